@@ -0,0 +1,62 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.module_loading import import_string
+
+
+def _page_view(request):
+    # Stand-in for a template that stamps the nonce onto an inline <script>.
+    # The bare-view baseline runs without the middleware, so there is no nonce.
+    nonce = getattr(request, 'csp_nonce', '')
+    return HttpResponse(f'<script nonce="{nonce}"></script>')
+
+
+def _api_view(request):
+    return HttpResponse('{}', content_type='application/json')
+
+
+def _build_chain(view):
+    handler = view
+    for middleware_path in reversed(settings.MIDDLEWARE):
+        handler = import_string(middleware_path)(handler)
+    return handler
+
+
+class Command(BaseCommand):
+    help = 'Measure per-request overhead of the full MIDDLEWARE stack.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations', type=int, default=20_000,
+            help='Requests to time per scenario (default: 20000).',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        factory = RequestFactory(HTTP_HOST=settings.ALLOWED_HOSTS[0])
+        scenarios = [
+            ('page', '/search/', _page_view),
+            ('api', '/api/v1/library/', _api_view),
+        ]
+
+        for label, path, view in scenarios:
+            requests = [factory.get(path) for _ in range(iterations)]
+            bare = self._time(view, requests)
+            requests = [factory.get(path) for _ in range(iterations)]
+            stacked = self._time(_build_chain(view), requests)
+            self.stdout.write(
+                f'{label:<5} {path:<18} '
+                f'view {bare * 1e6 / iterations:7.2f} us/req  '
+                f'stack {stacked * 1e6 / iterations:7.2f} us/req  '
+                f'overhead {(stacked - bare) * 1e6 / iterations:7.2f} us/req'
+            )
+
+    @staticmethod
+    def _time(handler, requests):
+        start = time.perf_counter()
+        for request in requests:
+            handler(request)
+        return time.perf_counter() - start
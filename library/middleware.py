@@ -1,34 +1,66 @@
 import base64
 import os
 
+from django.utils.functional import SimpleLazyObject, empty
+
+# Every directive except script-src is identical on every response, so the
+# policy is assembled once at import time and only the nonce is spliced in.
+_SCRIPT_SRC = "script-src 'self' ajax.googleapis.com"
+_POLICY_TEMPLATE = (
+    "default-src 'self'; "
+    "{script_src}; "
+    "style-src 'self' ajax.googleapis.com cdn.jsdelivr.net fonts.googleapis.com; "
+    "font-src fonts.gstatic.com cdn.jsdelivr.net; "
+    "img-src 'self' https: data:; "
+    "frame-ancestors 'none'"
+)
+STATIC_POLICY = _POLICY_TEMPLATE.format(script_src=_SCRIPT_SRC)
+_NONCE_POLICY_HEAD, _NONCE_POLICY_TAIL = _POLICY_TEMPLATE.format(
+    script_src="script-src 'self' 'nonce-{}' ajax.googleapis.com",
+).split('{}')
+
+
+def _generate_nonce():
+    return base64.b64encode(os.urandom(16)).decode('ascii')
+
 
 class ContentSecurityPolicyMiddleware:
     """
     Sets a Content-Security-Policy header on every response.
 
-    A fresh cryptographic nonce is generated for each request and stored on
+    For page requests a cryptographic nonce is exposed on
     ``request.csp_nonce`` so that Django templates can stamp it onto inline
     ``<script>`` tags with ``nonce="{{ request.csp_nonce }}"``.  The nonce is
-    included in the ``script-src`` directive, which means *only* script tags
-    that carry the matching nonce attribute are allowed to execute — all other
-    inline scripts are blocked.
+    generated lazily, the first time a template reads it, and is then included
+    in the ``script-src`` directive, which means *only* script tags that carry
+    the matching nonce attribute are allowed to execute — all other inline
+    scripts are blocked.  Responses that never read the nonce contain no
+    nonce-bearing scripts and receive the precomputed ``STATIC_POLICY``.
+
+    Requests under ``api_prefix`` return JSON and never render templates, so
+    no nonce is attached to them and they always receive ``STATIC_POLICY``.
     """
 
+    api_prefix = '/api/v1/'
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        nonce = base64.b64encode(os.urandom(16)).decode('ascii')
+        if request.path_info.startswith(self.api_prefix):
+            response = self.get_response(request)
+            response['Content-Security-Policy'] = STATIC_POLICY
+            return response
+
+        nonce = SimpleLazyObject(_generate_nonce)
         request.csp_nonce = nonce
 
         response = self.get_response(request)
 
-        response['Content-Security-Policy'] = (
-            "default-src 'self'; "
-            f"script-src 'self' 'nonce-{nonce}' ajax.googleapis.com; "
-            "style-src 'self' ajax.googleapis.com cdn.jsdelivr.net fonts.googleapis.com; "
-            "font-src fonts.gstatic.com cdn.jsdelivr.net; "
-            "img-src 'self' https: data:; "
-            "frame-ancestors 'none'"
-        )
+        if nonce._wrapped is empty:
+            response['Content-Security-Policy'] = STATIC_POLICY
+        else:
+            response['Content-Security-Policy'] = (
+                _NONCE_POLICY_HEAD + nonce._wrapped + _NONCE_POLICY_TAIL
+            )
         return response